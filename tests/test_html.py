@@ -1,7 +1,10 @@
 import os
 import sys
 
+import pytest
+
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import weather_slide
 from weather_slide import build_html
 
 
@@ -18,3 +21,23 @@ def test_build_html_basic():
     assert "Inwood Weather" in html
     assert "95 °F" in html
     assert "<tr><td>2025-07-14</td><td>90°</td><td>70°</td>" in html
+
+
+def test_build_html_below_policy_range():
+    daily = {
+        "apparent_temperature_max": [72],
+        "time": ["2025-10-01"],
+        "temperature_2m_max": [70],
+        "temperature_2m_min": [50],
+        "weathercode": [3],
+        "precipitation_probability_max": [0],
+    }
+    html = build_html(daily, "2025-10-01")
+    assert "72 °F (No Warning)" in html
+    assert "#ffcc66" not in html
+
+
+def test_send_email_requires_credentials(monkeypatch):
+    monkeypatch.setattr(weather_slide, "SG_KEY", None)
+    with pytest.raises(RuntimeError, match="Missing SendGrid key"):
+        weather_slide.send_email("<p></p>", "2025-07-14")
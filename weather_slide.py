@@ -10,14 +10,21 @@ Daily HTML weather e‑mail for Inwood, WV.
 Required packages (see requirements.txt):
     requests
     sendgrid
+
+Optional:
+    orjson   (faster forecast JSON decoding)
 """
 
 import os
 import datetime as dt
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
-from sendgrid import SendGridAPIClient
-from sendgrid.helpers.mail import Mail
+
+try:  # optional, faster JSON decoding
+    import orjson
+except ImportError:
+    orjson = None
 
 # ── configuration ───────────────────────────────────────────────────
 LATITUDE = float(os.getenv("LATITUDE", "39.36"))
@@ -27,15 +34,30 @@ SG_KEY = os.getenv("SENDGRID_API_KEY")
 EMAIL_FROM = os.getenv("EMAIL_FROM")
 EMAIL_TO = [e.strip() for e in os.getenv("EMAIL_TO", "").split(",") if e.strip()]
 
-if not (SG_KEY and EMAIL_FROM and EMAIL_TO):
-    raise RuntimeError("Missing SendGrid key or e‑mail addresses in environment.")
-
 POLICY = [
     (80, 90, "Caution", "30", "1/20", "Normal", "Periodic"),
     (91, 103, "Extreme Caution", "15", "1/15", "30-40/10", "1"),
     (104, 124, "Danger", "10", "1/10", "20-30/10", "2"),
     (125, 999, "Extreme Danger", "0", "1/10", "10-20/10", "4"),
 ]
+NO_WARNING = "No Warning"
+
+# heat index (°F, clamped to 0–999) → warning level
+_HI_TO_WARN = [NO_WARNING] * 1000
+for _lo, _hi, _warn, *_ in POLICY:
+    _HI_TO_WARN[_lo:_hi + 1] = [_warn] * (_hi + 1 - _lo)
+del _lo, _hi, _warn, _
+
+# policy table rows only differ day to day in which one is shaded
+_POLICY_ROWS = [
+    (
+        f"<tr{{shade}}><td>{warn}</td><td>{lo}-{hi if hi < 999 else '＋'}°</td>"
+        f"<td>{work}</td><td>{hyd}</td><td>{wr}</td><td>{chk}</td></tr>",
+        warn,
+    )
+    for lo, hi, warn, work, hyd, wr, chk in POLICY
+]
+_SHADE = " style='background:#ffcc66'"
 
 EMOJI = {
     0: "☀️", 1: "🌤️", 2: "⛅", 3: "☁️", 45: "🌫️", 48: "🌫️",
@@ -44,6 +66,27 @@ EMOJI = {
     95: "⛈️", 96: "⛈️", 99: "⛈️",
 }
 
+_HTML_TMPL = """
+<h2 style='margin-bottom:4px'>Inwood Weather — {today_str}</h2>
+<p style='margin:0;font-size:16px'><b>Peak Heat Index Today:</b> {hi_today} °F ({warn_lvl})</p>
+<p style='margin:0 0 8px;font-size:14px;color:#555'>Guidance below ⬇︎</p>
+<table border='1' cellpadding='4' cellspacing='0' style='border-collapse:collapse'>
+  <thead style='background:#4f81bd;color:#fff'>
+    <tr><th>Date</th><th>High °F</th><th>Low °F</th><th>Cond</th><th>Precip %</th></tr>
+  </thead><tbody>{rows}</tbody>
+</table>
+<h3 style='margin:14px 0 4px'>Heat‑Stress Work Practices</h3>
+<table border='1' cellpadding='4' cellspacing='0' style='border-collapse:collapse'>
+  <thead style='background:#4f81bd;color:#fff'>
+    <tr><th>Warning</th><th>HI °F</th><th>Work max</th><th>Hydration</th><th>Work/Rest</th><th>Checks/hr</th></tr>
+  </thead><tbody>{policy_html}</tbody>
+</table>
+"""
+
+# reuse one pooled connection to Open‑Meteo across requests
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=2))
+
 # ── helpers ─────────────────────────────────────────────────────────
 
 def fetch_forecast():
@@ -57,10 +100,13 @@ def fetch_forecast():
         f"&timezone={TIMEZONE}"
     )
     try:
-        resp = requests.get(url, timeout=15)
+        # (connect, read): give up quickly if the host is unreachable
+        resp = _SESSION.get(url, timeout=(5, 15))
         resp.raise_for_status()
     except RequestException as exc:
         raise RuntimeError(f"Forecast API request failed: {exc}") from exc
+    if orjson is not None:
+        return orjson.loads(resp.content)["daily"]
     return resp.json()["daily"]
 
 
@@ -69,55 +115,46 @@ def build_html(daily, today_str):
     hi_today = round(daily["apparent_temperature_max"][0])
 
     # determine heat‑stress warning level
-    for lo, hi, warn, work, hyd, wr, chk in POLICY:
-        if lo <= hi_today <= hi:
-            warn_lvl, work_max, hydration, work_rest, checks_hr = warn, work, hyd, wr, chk
-            break
+    warn_lvl = _HI_TO_WARN[min(max(hi_today, 0), 999)]
 
-    rows = ""
+    rows = []
+    add_row, emoji_get = rows.append, EMOJI.get
     for d, hi, lo, code, rain in zip(
         daily["time"],
-        daily["temperature_2m_max"],
-        daily["temperature_2m_min"],
+        map(int, daily["temperature_2m_max"]),
+        map(int, daily["temperature_2m_min"]),
         daily["weathercode"],
         daily["precipitation_probability_max"],
     ):
-        rows += (
-            f"<tr><td>{d}</td><td>{int(hi)}°</td><td>{int(lo)}°</td>"
-            f"<td style='text-align:center;font-size:1.2em'>{EMOJI.get(code,'')}</td>"
+        add_row(
+            f"<tr><td>{d}</td><td>{hi}°</td><td>{lo}°</td>"
+            f"<td style='text-align:center;font-size:1.2em'>{emoji_get(code,'')}</td>"
             f"<td>{rain}%</td></tr>"
         )
+    rows = "".join(rows)
 
-    policy_html = ""
-    for lo, hi, warn, work, hyd, wr, chk in POLICY:
-        shade = " style='background:#ffcc66'" if warn == warn_lvl else ""
-        hi_range = f"{lo}-{hi if hi < 999 else '＋'}"
-        policy_html += (
-            f"<tr{shade}><td>{warn}</td><td>{hi_range}°</td><td>{work}</td>"
-            f"<td>{hyd}</td><td>{wr}</td><td>{chk}</td></tr>"
-        )
+    policy_html = "".join(
+        tmpl.format(shade=_SHADE if warn == warn_lvl else "")
+        for tmpl, warn in _POLICY_ROWS
+    )
 
-    html = f"""
-<h2 style='margin-bottom:4px'>Inwood Weather — {today_str}</h2>
-<p style='margin:0;font-size:16px'><b>Peak Heat Index Today:</b> {hi_today} °F ({warn_lvl})</p>
-<p style='margin:0 0 8px;font-size:14px;color:#555'>Guidance below ⬇︎</p>
-<table border='1' cellpadding='4' cellspacing='0' style='border-collapse:collapse'>
-  <thead style='background:#4f81bd;color:#fff'>
-    <tr><th>Date</th><th>High °F</th><th>Low °F</th><th>Cond</th><th>Precip %</th></tr>
-  </thead><tbody>{rows}</tbody>
-</table>
-<h3 style='margin:14px 0 4px'>Heat‑Stress Work Practices</h3>
-<table border='1' cellpadding='4' cellspacing='0' style='border-collapse:collapse'>
-  <thead style='background:#4f81bd;color:#fff'>
-    <tr><th>Warning</th><th>HI °F</th><th>Work max</th><th>Hydration</th><th>Work/Rest</th><th>Checks/hr</th></tr>
-  </thead><tbody>{policy_html}</tbody>
-</table>
-"""
-    return html
+    return _HTML_TMPL.format(
+        today_str=today_str,
+        hi_today=hi_today,
+        warn_lvl=warn_lvl,
+        rows=rows,
+        policy_html=policy_html,
+    )
 
 
 def send_email(html, today_str):
     """Send the given HTML via SendGrid."""
+    if not (SG_KEY and EMAIL_FROM and EMAIL_TO):
+        raise RuntimeError("Missing SendGrid key or e‑mail addresses in environment.")
+
+    from sendgrid import SendGridAPIClient
+    from sendgrid.helpers.mail import Mail
+
     sg = SendGridAPIClient(SG_KEY)
     msg = Mail(
         from_email=EMAIL_FROM,